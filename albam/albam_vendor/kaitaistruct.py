@@ -1,9 +1,12 @@
-import itertools
-import sys
+import os
 import struct
+from functools import lru_cache
 from io import open, BytesIO, SEEK_CUR, SEEK_END  # noqa
 
-PY2 = sys.version_info[0] == 2
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Kaitai Struct runtime version, in the format defined by PEP 440.
 # Used by our setup.cfg to set the version number in
@@ -73,6 +76,17 @@ class ReadWriteKaitaiStruct(KaitaiStruct):
 class KaitaiStream(object):
     def __init__(self, io):
         self._io = io
+        # Bound methods of the underlying stream, cached so the hot paths
+        # pay one LOAD_FAST instead of two attribute lookups per call. The
+        # wrapped io object never changes for the lifetime of the stream.
+        self._io_read = io.read
+        self._io_readinto = io.readinto
+        self._io_seek = io.seek
+        self._io_tell = io.tell
+        # Scratch buffer reused by all fixed-size numeric reads: together with
+        # readinto() + Struct.unpack_from(), it avoids allocating a fresh bytes
+        # object for every primitive read.
+        self._scratch = bytearray(8)
         self.align_to_byte()
         self.bits_le = False
         self.bits_write_mode = False
@@ -82,17 +96,13 @@ class KaitaiStream(object):
 
         try:
             self._size = self.size()
-        # IOError is for Python 2 (IOError also exists in Python 3, but it has
-        # become just an alias for OSError).
-        #
         # Although I haven't actually seen a bare ValueError raised in this case
         # in practice, chances are some implementation may be doing it (see
         # <https://docs.python.org/3/library/io.html#io.IOBase> for reference:
         # "Also, implementations may raise a ValueError (or
         # UnsupportedOperation) when operations they do not support are
-        # called."). And I've seen ValueError raised at least in Python 2 when
-        # calling read() on an unreadable stream.
-        except (OSError, IOError, ValueError):
+        # called.").
+        except (OSError, ValueError):
             # tell() or seek() failed - we have a non-seekable stream (which is
             # fine for reading, but writing will fail, see
             # _write_bytes_not_aligned())
@@ -122,7 +132,16 @@ class KaitaiStream(object):
         # that is_eof() may be called from both read and write contexts, it's
         # more universal not to use read() at all. See also
         # <https://github.com/kaitai-io/kaitai_struct_python_runtime/issues/75>.
-        return self._io.tell() >= self.size()
+        #
+        # The size cached by __init__ is used instead of calling size(), which
+        # costs a tell/seek/seek round-trip per call. Streams handled by this
+        # runtime are fixed-size: writing past the end is forbidden by
+        # _ensure_bytes_left_to_write(), so the cache can't go stale.
+        try:
+            full_size = self._size
+        except AttributeError:
+            full_size = self.size()
+        return self._io_tell() >= full_size
 
     def seek(self, n):
         if self.bits_write_mode:
@@ -130,33 +149,33 @@ class KaitaiStream(object):
         else:
             self.align_to_byte()
 
-        self._io.seek(n)
+        self._io_seek(n)
 
     def pos(self):
-        return self._io.tell() + (1 if self.bits_write_mode and self.bits_left > 0 else 0)
+        return self._io_tell() + (1 if self.bits_write_mode and self.bits_left > 0 else 0)
 
     def size(self):
+        io = self._io
+
+        # For real files, fstat reports the size directly, saving the
+        # three-syscall tell/seek-to-end/seek-back trick below.
+        try:
+            fd = io.fileno()
+        # BytesIO raises io.UnsupportedOperation, which subclasses both
+        # OSError and ValueError; AttributeError covers file-like objects
+        # without fileno() at all.
+        except (AttributeError, OSError, ValueError):
+            pass
+        else:
+            return os.fstat(fd).st_size
+
         # Python has no internal File object API function to get
         # current file / StringIO size, thus we use the following
         # trick.
-        io = self._io
         # Remember our current position
         cur_pos = io.tell()
         # Seek to the end of the stream and remember the full length
         full_size = io.seek(0, SEEK_END)
-
-        if full_size is None:
-            # In Python 2, the seek() method of 'file' objects (created by the
-            # built-in open() function) has no return value, so we have to call
-            # tell() ourselves to get the new absolute position - see
-            # <https://github.com/kaitai-io/kaitai_struct_python_runtime/issues/72>.
-            #
-            # In Python 3, seek() methods of all
-            # <https://docs.python.org/3/library/io.html> streams return the new
-            # position already, so this won't be needed once we drop support for
-            # Python 2.
-            full_size = io.tell()
-
         # Seek back to the current position
         io.seek(cur_pos)
         return full_size
@@ -190,95 +209,112 @@ class KaitaiStream(object):
 
     # region Reading
 
-    # region Integer numbers
-
-    # region Signed
-
-    def read_s1(self):
-        return KaitaiStream.packer_s1.unpack(self.read_bytes(1))[0]
-
-    # region Big-endian
-
-    def read_s2be(self):
-        return KaitaiStream.packer_s2be.unpack(self.read_bytes(2))[0]
+    def _read_into(self, n):
+        """Reads `n` bytes into the scratch buffer, without allocating a new
+        bytes object. Same EOF semantics as _read_bytes_not_aligned().
+        """
+        num_read = self._io_readinto(memoryview(self._scratch)[:n])
+        if num_read != n:
+            raise EOFError(
+                "requested %d bytes, but only %d bytes available" %
+                (n, num_read or 0)
+            )
 
-    def read_s4be(self):
-        return KaitaiStream.packer_s4be.unpack(self.read_bytes(4))[0]
+    # region Integer and floating point numbers
 
-    def read_s8be(self):
-        return KaitaiStream.packer_s8be.unpack(self.read_bytes(8))[0]
+    # read_s1, read_s2be, ..., read_u4le, ..., read_f8le are all generated
+    # from the packer_* Structs by _install_fixed_size_readers() below the
+    # class body: the 18 methods only differed in the Struct used and the
+    # number of bytes read.
 
     # endregion
 
-    # region Little-endian
-
-    def read_s2le(self):
-        return KaitaiStream.packer_s2le.unpack(self.read_bytes(2))[0]
+    # region Arrays of numbers
 
-    def read_s4le(self):
-        return KaitaiStream.packer_s4le.unpack(self.read_bytes(4))[0]
+    # Threshold (in elements) above which numpy.frombuffer, when available,
+    # beats a compiled struct.Struct for bulk array reads.
+    NUMPY_ARRAY_THRESHOLD = 1024
 
-    def read_s8le(self):
-        return KaitaiStream.packer_s8le.unpack(self.read_bytes(8))[0]
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _array_packer(fmt, count):
+        return struct.Struct('%s%d%s' % (fmt[0], count, fmt[1]))
+
+    def _read_array(self, fmt, itemsize, count):
+        """Reads `count` numbers of `itemsize` bytes each with a single
+        read() call and a single unpack, instead of one stream round-trip
+        per element.
+        """
+        if self.bits_left:
+            self.align_to_byte()
+        buf = self._read_bytes_not_aligned(itemsize * count)
+        if np is not None and count >= KaitaiStream.NUMPY_ARRAY_THRESHOLD:
+            return np.frombuffer(buf, dtype=fmt).tolist()
+        return list(KaitaiStream._array_packer(fmt, count).unpack(buf))
 
-    # endregion
+    # region Signed
 
-    # endregion
+    def read_s1_array(self, count):
+        return self._read_array('<b', 1, count)
 
-    # region Unsigned
+    def read_s2be_array(self, count):
+        return self._read_array('>h', 2, count)
 
-    def read_u1(self):
-        return KaitaiStream.packer_u1.unpack(self.read_bytes(1))[0]
+    def read_s4be_array(self, count):
+        return self._read_array('>i', 4, count)
 
-    # region Big-endian
+    def read_s8be_array(self, count):
+        return self._read_array('>q', 8, count)
 
-    def read_u2be(self):
-        return KaitaiStream.packer_u2be.unpack(self.read_bytes(2))[0]
+    def read_s2le_array(self, count):
+        return self._read_array('<h', 2, count)
 
-    def read_u4be(self):
-        return KaitaiStream.packer_u4be.unpack(self.read_bytes(4))[0]
+    def read_s4le_array(self, count):
+        return self._read_array('<i', 4, count)
 
-    def read_u8be(self):
-        return KaitaiStream.packer_u8be.unpack(self.read_bytes(8))[0]
+    def read_s8le_array(self, count):
+        return self._read_array('<q', 8, count)
 
     # endregion
 
-    # region Little-endian
-
-    def read_u2le(self):
-        return KaitaiStream.packer_u2le.unpack(self.read_bytes(2))[0]
+    # region Unsigned
 
-    def read_u4le(self):
-        return KaitaiStream.packer_u4le.unpack(self.read_bytes(4))[0]
+    def read_u1_array(self, count):
+        return self._read_array('<B', 1, count)
 
-    def read_u8le(self):
-        return KaitaiStream.packer_u8le.unpack(self.read_bytes(8))[0]
+    def read_u2be_array(self, count):
+        return self._read_array('>H', 2, count)
 
-    # endregion
+    def read_u4be_array(self, count):
+        return self._read_array('>I', 4, count)
 
-    # endregion
+    def read_u8be_array(self, count):
+        return self._read_array('>Q', 8, count)
 
-    # endregion
+    def read_u2le_array(self, count):
+        return self._read_array('<H', 2, count)
 
-    # region Floating point numbers
+    def read_u4le_array(self, count):
+        return self._read_array('<I', 4, count)
 
-    # region Big-endian
+    def read_u8le_array(self, count):
+        return self._read_array('<Q', 8, count)
 
-    def read_f4be(self):
-        return KaitaiStream.packer_f4be.unpack(self.read_bytes(4))[0]
+    # endregion
 
-    def read_f8be(self):
-        return KaitaiStream.packer_f8be.unpack(self.read_bytes(8))[0]
+    # region Floating point
 
-    # endregion
+    def read_f4be_array(self, count):
+        return self._read_array('>f', 4, count)
 
-    # region Little-endian
+    def read_f8be_array(self, count):
+        return self._read_array('>d', 8, count)
 
-    def read_f4le(self):
-        return KaitaiStream.packer_f4le.unpack(self.read_bytes(4))[0]
+    def read_f4le_array(self, count):
+        return self._read_array('<f', 4, count)
 
-    def read_f8le(self):
-        return KaitaiStream.packer_f8le.unpack(self.read_bytes(8))[0]
+    def read_f8le_array(self, count):
+        return self._read_array('<d', 8, count)
 
     # endregion
 
@@ -296,7 +332,9 @@ class KaitaiStream(object):
         res = 0
 
         bits_needed = n - self.bits_left
-        self.bits_left = -bits_needed % 8
+        # same as `-bits_needed % 8`, but & is cheaper than % and behaves
+        # identically for negative operands in Python
+        self.bits_left = -bits_needed & 7
 
         if bits_needed > 0:
             # 1 bit  => 1 byte
@@ -304,10 +342,7 @@ class KaitaiStream(object):
             # 9 bits => 2 bytes
             bytes_needed = ((bits_needed - 1) // 8) + 1  # `ceil(bits_needed / 8)`
             buf = self._read_bytes_not_aligned(bytes_needed)
-            if PY2:
-                buf = bytearray(buf)
-            for byte in buf:
-                res = res << 8 | byte
+            res = int.from_bytes(buf, 'big')
 
             new_bits = res
             res = res >> self.bits_left | self.bits << bits_needed
@@ -337,10 +372,7 @@ class KaitaiStream(object):
             # 9 bits => 2 bytes
             bytes_needed = ((bits_needed - 1) // 8) + 1  # `ceil(bits_needed / 8)`
             buf = self._read_bytes_not_aligned(bytes_needed)
-            if PY2:
-                buf = bytearray(buf)
-            for i, byte in enumerate(buf):
-                res |= byte << (i * 8)
+            res = int.from_bytes(buf, 'little')
 
             new_bits = res >> bits_needed
             res = res << self.bits_left | self.bits
@@ -349,7 +381,7 @@ class KaitaiStream(object):
             res = self.bits
             self.bits >>= n
 
-        self.bits_left = -bits_needed % 8
+        self.bits_left = -bits_needed & 7
 
         mask = (1 << n) - 1  # no problem with this in Python (arbitrary precision integers)
         res &= mask
@@ -360,56 +392,73 @@ class KaitaiStream(object):
     # region Byte arrays
 
     def read_bytes(self, n):
-        self.align_to_byte()
+        # align_to_byte() is a no-op when there is no pending bit buffer
+        # (the overwhelmingly common case), so don't pay for the call.
+        if self.bits_left:
+            self.align_to_byte()
         return self._read_bytes_not_aligned(n)
 
     def _read_bytes_not_aligned(self, n):
+        # Fast path for small reads (the overwhelming majority): read
+        # unconditionally and check the length afterwards, with no other
+        # branches or checks on the way.
+        if 0 <= n < 8*1024*1024:  # = 8 MiB
+            r = self._io_read(n)
+            if len(r) < n:
+                raise EOFError(
+                    "requested %d bytes, but only %d bytes available" %
+                    (n, len(r))
+                )
+            return r
+
         if n < 0:
             raise ValueError(
                 "requested invalid %d amount of bytes" %
                 (n,)
             )
 
-        is_satisfiable = True
         # When a large number of bytes is requested, try to check first
         # that there is indeed enough data left in the stream.
         # This avoids reading large amounts of data only to notice afterwards
-        # that it's not long enough. For smaller amounts of data, it's faster to
-        # first read the data unconditionally and check the length afterwards.
-        if (
-            n >= 8*1024*1024  # = 8 MiB
-            # in Python 2, there is a common error ['file' object has no
-            # attribute 'seekable'], so we need to make sure that seekable() exists
-            and callable(getattr(self._io, 'seekable', None))
-            and self._io.seekable()
-        ):
+        # that it's not long enough.
+        # file-like objects outside the io hierarchy may lack seekable()
+        if callable(getattr(self._io, 'seekable', None)) and self._io.seekable():
             num_bytes_available = self.size() - self.pos()
-            is_satisfiable = (n <= num_bytes_available)
-
-        if is_satisfiable:
-            r = self._io.read(n)
-            num_bytes_available = len(r)
-            is_satisfiable = (n <= num_bytes_available)
-
-        if not is_satisfiable:
-            # noinspection PyUnboundLocalVariable
+            if n > num_bytes_available:
+                raise EOFError(
+                    "requested %d bytes, but only %d bytes available" %
+                    (n, num_bytes_available)
+                )
+
+        r = self._io_read(n)
+        if len(r) < n:
             raise EOFError(
                 "requested %d bytes, but only %d bytes available" %
-                (n, num_bytes_available)
+                (n, len(r))
             )
-
-        # noinspection PyUnboundLocalVariable
         return r
 
     def read_bytes_full(self):
-        self.align_to_byte()
-        return self._io.read()
+        if self.bits_left:
+            self.align_to_byte()
+        return self._io_read()
+
+    # Chunk size used when scanning for a terminator byte in seekable streams.
+    TERM_CHUNK_SIZE = 1024
 
     def read_bytes_term(self, term, include_term, consume_term, eos_error):
-        self.align_to_byte()
-        r = b''
+        if self.bits_left:
+            self.align_to_byte()
+        if callable(getattr(self._io, 'seekable', None)) and self._io.seekable():
+            return self._read_bytes_term_seekable(term, include_term, consume_term, eos_error)
+
+        # Non-seekable streams can't rewind past the terminator, so bytes
+        # have to be consumed one at a time. Accumulating into a bytearray
+        # is amortized O(1) per byte, unlike `bytes + bytes` which reallocates
+        # and copies the whole result on every append.
+        r = bytearray()
         while True:
-            c = self._io.read(1)
+            c = self._io_read(1)
             if c == b'':
                 if eos_error:
                     raise Exception(
@@ -417,17 +466,41 @@ class KaitaiStream(object):
                         (term,)
                     )
 
-                return r
+                return bytes(r)
 
             if ord(c) == term:
                 if include_term:
                     r += c
                 if not consume_term:
-                    self._io.seek(-1, SEEK_CUR)
-                return r
+                    self._io_seek(-1, SEEK_CUR)
+                return bytes(r)
 
             r += c
 
+    def _read_bytes_term_seekable(self, term, include_term, consume_term, eos_error):
+        # Read the stream in chunks and let bytes.find() scan for the
+        # terminator in C, seeking back over whatever was read past it.
+        term_byte = KaitaiStream.byte_from_int(term)
+        r = bytearray()
+        while True:
+            buf = self._io_read(KaitaiStream.TERM_CHUNK_SIZE)
+            if buf == b'':
+                if eos_error:
+                    raise Exception(
+                        "end of stream reached, but no terminator %d found" %
+                        (term,)
+                    )
+
+                return bytes(r)
+
+            idx = buf.find(term_byte)
+            if idx != -1:
+                r += buf[:idx + 1] if include_term else buf[:idx]
+                self._io_seek(idx + (1 if consume_term else 0) - len(buf), SEEK_CUR)
+                return bytes(r)
+
+            r += buf
+
     def ensure_fixed_contents(self, expected):
         actual = self._io.read(len(expected))
         if actual != expected:
@@ -615,17 +688,15 @@ class KaitaiStream(object):
         self.bits_left = bits_to_write % 8
 
         if bytes_to_write > 0:
-            buf = bytearray(bytes_to_write)
-
             mask = (1 << self.bits_left) - 1  # `bits_left` is in range 0..7
             new_bits = val & mask
             val = val >> self.bits_left | self.bits << (n - self.bits_left)
             self.bits = new_bits
 
-            for i in range(bytes_to_write - 1, -1, -1):
-                buf[i] = val & 0xff
-                val >>= 8
-            self._write_bytes_not_aligned(buf)
+            # `val` holds exactly `bytes_to_write * 8` bits at this point, so
+            # int.to_bytes() serializes it in one go instead of a Python loop
+            # peeling off one byte per iteration.
+            self._write_bytes_not_aligned(val.to_bytes(bytes_to_write, 'big'))
         else:
             self.bits = self.bits << n | val
 
@@ -647,16 +718,15 @@ class KaitaiStream(object):
         self.bits_left = bits_to_write % 8
 
         if bytes_to_write > 0:
-            buf = bytearray(bytes_to_write)
-
             new_bits = val >> (n - self.bits_left)  # no problem with this in Python (arbitrary precision integers)
             val = val << old_bits_left | self.bits
             self.bits = new_bits
 
-            for i in range(bytes_to_write):
-                buf[i] = val & 0xff
-                val >>= 8
-            self._write_bytes_not_aligned(buf)
+            # Unlike the BE variant, `val` is not masked to `n` bits on entry,
+            # so truncate it to the bytes actually written before handing it
+            # to int.to_bytes() (the old loop dropped the excess implicitly).
+            val &= (1 << (bytes_to_write * 8)) - 1
+            self._write_bytes_not_aligned(val.to_bytes(bytes_to_write, 'little'))
         else:
             self.bits |= val << old_bits_left
 
@@ -668,22 +738,35 @@ class KaitaiStream(object):
     # region Byte arrays
 
     def write_bytes(self, buf):
-        self.write_align_to_byte()
-        self._write_bytes_not_aligned(buf)
+        if self.bits_left > 0:
+            # Instead of letting write_align_to_byte() issue a separate
+            # one-byte write, prepend the flushed bit-buffer byte to `buf`
+            # and hit the stream once. The bit buffer is cleared before
+            # writing for the same reason documented in
+            # write_align_to_byte().
+            b = self.bits
+            if not self.bits_le:
+                b <<= 8 - self.bits_left
+            self.align_to_byte()
+            self._write_bytes_not_aligned(KaitaiStream.byte_from_int(b) + buf)
+        else:
+            self._write_bytes_not_aligned(buf)
 
     def _write_bytes_not_aligned(self, buf):
         n = len(buf)
-        self._ensure_bytes_left_to_write(n, self._io.tell())
+        self._ensure_bytes_left_to_write(n, self._io_tell())
         self._io.write(buf)
 
     def write_bytes_limit(self, buf, size, term, pad_byte):
         n = len(buf)
         self.write_bytes(buf)
         if n < size:
-            self.write_u1(term)
-            pad_len = size - n - 1
-            for _ in range(pad_len):
-                self.write_u1(pad_byte)
+            # Build the terminator plus padding as one buffer and emit it
+            # with a single write instead of one write_u1() per byte.
+            self.write_bytes(
+                KaitaiStream.byte_from_int(term) +
+                KaitaiStream.byte_from_int(pad_byte) * (size - n - 1)
+            )
         elif n > size:
             raise ValueError("writing %d bytes, but %d bytes were given" % (size, n))
 
@@ -695,17 +778,37 @@ class KaitaiStream(object):
 
     @staticmethod
     def process_xor_one(data, key):
-        if PY2:
-            return bytes(bytearray(v ^ key for v in bytearray(data)))
+        n = len(data)
+        if np is not None and n >= KaitaiStream.NUMPY_ARRAY_THRESHOLD:
+            return (np.frombuffer(data, dtype=np.uint8) ^ key).tobytes()
 
-        return bytes(v ^ key for v in data)
+        # XOR the whole buffer as one big integer: `rep_mask` is
+        # 0x0101...01 (n bytes), so `rep_mask * key` is the key repeated
+        # for every byte of `data`.
+        rep_mask = ((1 << (8 * n)) - 1) // 255
+        return (int.from_bytes(data, 'big') ^ (rep_mask * key)).to_bytes(n, 'big')
 
     @staticmethod
     def process_xor_many(data, key):
-        if PY2:
-            return bytes(bytearray(a ^ b for a, b in zip(bytearray(data), itertools.cycle(bytearray(key)))))
+        key_len = len(key)
+        if key_len == 1:
+            return KaitaiStream.process_xor_one(data, key[0])
+
+        n = len(data)
+        if np is not None and n >= KaitaiStream.NUMPY_ARRAY_THRESHOLD:
+            key_arr = np.resize(np.frombuffer(key, dtype=np.uint8), n)
+            return (np.frombuffer(data, dtype=np.uint8) ^ key_arr).tobytes()
 
-        return bytes(a ^ b for a, b in zip(data, itertools.cycle(key)))
+        full_key = (key * (n // key_len + 1))[:n]
+        return (int.from_bytes(data, 'big') ^ int.from_bytes(full_key, 'big')).to_bytes(n, 'big')
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _rotate_left_table(amount):
+        anti_amount = -amount % 8
+        return bytes(
+            bytearray((byte << amount) & 0xff | (byte >> anti_amount) for byte in range(256))
+        )
 
     @staticmethod
     def process_rotate_left(data, amount, group_size):
@@ -715,12 +818,10 @@ class KaitaiStream(object):
                 (group_size,)
             )
 
-        anti_amount = -amount % (group_size * 8)
-
-        r = bytearray(data)
-        for i, byte in enumerate(r):
-            r[i] = (byte << amount) & 0xff | (byte >> anti_amount)
-        return bytes(r)
+        # The rotation of a single byte only has 256 possible outcomes, so
+        # instead of rotating byte by byte in the interpreter, build a lookup
+        # table once per `amount` and let bytes.translate() do the work in C.
+        return data.translate(KaitaiStream._rotate_left_table(amount))
 
     # endregion
 
@@ -728,23 +829,27 @@ class KaitaiStream(object):
 
     @staticmethod
     def int_from_byte(v):
-        return ord(v) if PY2 else v
+        return v
+
+    # All 256 single-byte values, precomputed so that byte_from_int() is a
+    # tuple index instead of constructing a fresh bytes object per call.
+    _bytes_by_int = tuple(bytes((i,)) for i in range(256))
 
     @staticmethod
     def byte_from_int(i):
-        return chr(i) if PY2 else bytes((i,))
+        return KaitaiStream._bytes_by_int[i]
 
     @staticmethod
     def byte_array_index(data, i):
-        return KaitaiStream.int_from_byte(data[i])
+        return data[i]
 
     @staticmethod
     def byte_array_min(b):
-        return KaitaiStream.int_from_byte(min(b))
+        return min(b)
 
     @staticmethod
     def byte_array_max(b):
-        return KaitaiStream.int_from_byte(max(b))
+        return max(b)
 
     @staticmethod
     def byte_array_index_of(data, b):
@@ -764,6 +869,12 @@ class KaitaiStream(object):
     # endregion
 
     def to_byte_array(self):
+        # BytesIO exposes its whole buffer directly, so the
+        # seek-to-0/read/seek-back round-trip below can be skipped. Only
+        # valid with no bits pending: the seek would flush/clear those.
+        if self.bits_left == 0 and isinstance(self._io, BytesIO):
+            return self._io.getvalue()
+
         pos = self.pos()
         self.seek(0)
         r = self.read_bytes_full()
@@ -787,10 +898,7 @@ class KaitaiStream(object):
         for child in self.child_streams:
             child.write_back_child_streams(self)
 
-        # NOTE: Python 2 doesn't have list.clear() so it can't be used, see
-        # https://docs.python.org/3.11/library/stdtypes.html#mutable-sequence-types
-        # ("New in version 3.3: clear() and copy() methods.")
-        del self.child_streams[:]
+        self.child_streams.clear()
         self.seek(_pos)
         if parent is not None:
             self._write_back(parent)
@@ -799,6 +907,37 @@ class KaitaiStream(object):
         self.write_back_handler.write_back(parent)
 
 
+def _make_fixed_size_reader(name, packer):
+    # `size` and `unpack_from` are closed over as locals, which is cheaper
+    # per call than looking the packer up on the class.
+    size = packer.size
+    unpack_from = packer.unpack_from
+
+    def reader(self):
+        if self.bits_left:
+            self.align_to_byte()
+        self._read_into(size)
+        return unpack_from(self._scratch, 0)[0]
+
+    reader.__name__ = name
+    reader.__qualname__ = 'KaitaiStream.' + name
+    return reader
+
+
+def _install_fixed_size_readers():
+    for type_name in (
+        's1', 's2be', 's4be', 's8be', 's2le', 's4le', 's8le',
+        'u1', 'u2be', 'u4be', 'u8be', 'u2le', 'u4le', 'u8le',
+        'f4be', 'f8be', 'f4le', 'f8le',
+    ):
+        packer = getattr(KaitaiStream, 'packer_' + type_name)
+        name = 'read_' + type_name
+        setattr(KaitaiStream, name, _make_fixed_size_reader(name, packer))
+
+
+_install_fixed_size_readers()
+
+
 class KaitaiStructError(Exception):
     """Common ancestor for all error originating from Kaitai Struct usage.
     Stores KSY source path, pointing to an element supposedly guilty of
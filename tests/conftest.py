@@ -22,3 +22,9 @@ def pytest_addoption(parser):
         action="store",
         help="Path to json file containing files to import. See tests/mtfw/datasets for examples"
     )
+    parser.addoption(
+        "--no-mod-cache",
+        action="store_true",
+        help="Always run the Blender import/export round trip, ignoring "
+        "exported files cached in .pytest_cache from previous runs",
+    )
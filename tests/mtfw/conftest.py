@@ -1,13 +1,100 @@
+import hashlib
 import os
 import io
 import json
+import operator
+import tempfile
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from pathlib import Path
+from types import SimpleNamespace
 
 import bpy
+import numpy as np
 import pytest
 
 
 MTFW_DATASET = []
 
+V21_VERSIONS = frozenset({210, 211})
+
+BONE_DTYPE = np.dtype([
+    ("idx_anim_map", "u1"),
+    ("idx_parent", "u1"),
+    ("idx_mirror", "u1"),
+    ("idx_mapping", "u1"),
+    ("unk_01", "f4"),
+    ("parent_distance", "f4"),
+    ("location_x", "f4"),
+    ("location_y", "f4"),
+    ("location_z", "f4"),
+])
+
+GROUP_DTYPE = np.dtype([
+    ("group_index", "u4"),
+    ("unk_02", "f4"),
+    ("unk_03", "f4"),
+    ("unk_04", "f4"),
+    ("unk_05", "f4"),
+    ("unk_06", "f4"),
+    ("unk_07", "f4"),
+    ("unk_08", "f4"),
+])
+
+
+# All fields the mesh tests look at, for version 21 meshes
+MESH_DTYPE_21 = np.dtype([
+    ("idx_group", "u2"),
+    ("num_vertices", "u2"),
+    ("unk_01", "u1"),
+    ("idx_material", "u2"),
+    ("level_of_detail", "u1"),
+    ("type_mesh", "u1"),
+    ("unk_class_mesh", "u1"),
+    ("unk_render_mode", "u1"),
+    ("bone_id_start", "u1"),
+    ("num_unique_bone_ids", "u1"),
+    ("mesh_index", "u2"),
+    ("min_index", "u2"),
+    ("max_index", "u2"),
+    ("hash", "u4"),
+    ("vertex_position", "u4"),
+    ("vertex_offset", "u4"),
+    ("face_position", "u4"),
+    ("num_indices", "u4"),
+    ("face_offset", "u4"),
+])
+
+# Subset shared with version 156 meshes; only these are compared there
+MESH_DTYPE_OFFSETS = np.dtype([
+    ("vertex_position", "u4"),
+    ("vertex_offset", "u4"),
+    ("face_position", "u4"),
+    ("num_indices", "u4"),
+    ("face_offset", "u4"),
+])
+
+
+def _bones_to_ndarray(bones_hierarchy):
+    return np.fromiter(
+        ((b.idx_anim_map, b.idx_parent, b.idx_mirror, b.idx_mapping,
+          b.unk_01, b.parent_distance,
+          b.location.x, b.location.y, b.location.z)
+         for b in bones_hierarchy),
+        dtype=BONE_DTYPE, count=len(bones_hierarchy))
+
+
+def _groups_to_ndarray(groups):
+    return np.fromiter(
+        ((g.group_index, g.unk_02, g.unk_03, g.unk_04, g.unk_05, g.unk_06, g.unk_07, g.unk_08)
+         for g in groups),
+        dtype=GROUP_DTYPE, count=len(groups))
+
+
+def _meshes_to_ndarray(meshes, dtype):
+    getter = operator.attrgetter(*dtype.names)
+    return np.fromiter((getter(m) for m in meshes), dtype=dtype, count=len(meshes))
+
 
 def pytest_generate_tests(metafunc):
     global MTFW_DATASET
@@ -31,6 +118,18 @@ def pytest_generate_tests(metafunc):
             argvalues.append((app_id, mod_path, mrl_path))
         metafunc.parametrize(argnames, argvalues, scope="session")
 
+        if "mesh_index" in metafunc.fixturenames:
+            # One test per mesh, so failures get distinct ids and xdist can
+            # fan them out. The mesh count is only known after the Blender
+            # import/export runs, so it must come from an optional
+            # "num_meshes" key in the dataset; without it, a single None
+            # parameter tells the test to cover all meshes in one go.
+            max_meshes = max((d.get("num_meshes", 0) for d in MTFW_DATASET), default=0)
+            if max_meshes:
+                metafunc.parametrize("mesh_index", range(max_meshes))
+            else:
+                metafunc.parametrize("mesh_index", [None], ids=["all-meshes"])
+
     elif "parsed_mrl_from_arc" in metafunc.fixturenames:
         _generate_tests_from_arcs("mrl", metafunc, "parsed_mrl_from_arc")
     elif "parsed_lmt_from_arc" in metafunc.fixturenames:
@@ -60,12 +159,60 @@ def loaded_arcs(pytestconfig):
         bpy.ops.albam.add_files(directory=arc_dir, files=files)
 
 
-@pytest.fixture(scope="session")
-def mod_export(loaded_arcs, app_id, mod_path, mrl_path):
-    from albam.engines.mtfw.mesh import APPID_CLASS_MAPPER
-    from albam.engines.mtfw.structs.mrl import Mrl
-    from kaitaistruct import KaitaiStream
+@lru_cache(maxsize=1)
+def _exporter_code_digest():
+    """
+    Digest of the import/export code itself, so cache entries produced by
+    an older exporter are never reused while iterating on it.
+    """
+    import albam
+
+    hasher = hashlib.sha256()
+    albam_dir = Path(albam.__file__).parent
+    for subdir in ("engines/mtfw", "lib"):
+        for py_path in sorted((albam_dir / subdir).rglob("*.py")):
+            hasher.update(py_path.read_bytes())
+    return hasher.digest()
+
+
+def _mod_export_cache_load(config, digest, has_mrl):
+    if config.getoption("no_mod_cache"):
+        return None
+    cache_dir = config.cache.mkdir("albam-mod-export")
+    mod_file = cache_dir / f"{digest}.mod"
+    mrl_file = cache_dir / f"{digest}.mrl"
+    if not mod_file.is_file() or (has_mrl and not mrl_file.is_file()):
+        return None
+    return mod_file.read_bytes(), (mrl_file.read_bytes() if has_mrl else None)
+
+
+def _write_bytes_atomic(path, data):
+    # Write-then-rename so concurrent pytest-xdist workers never see a
+    # half-written cache file; a lost race just overwrites with the same bytes
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".")
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def _mod_export_cache_store(config, digest, dst_mod_bytes, dst_mrl_bytes):
+    if config.getoption("no_mod_cache"):
+        return
+    cache_dir = config.cache.mkdir("albam-mod-export")
+    _write_bytes_atomic(cache_dir / f"{digest}.mod", dst_mod_bytes)
+    if dst_mrl_bytes is not None:
+        _write_bytes_atomic(cache_dir / f"{digest}.mrl", dst_mrl_bytes)
+
 
+@pytest.fixture(scope="session")
+def mod_export_bytes(pytestconfig, loaded_arcs, app_id, mod_path, mrl_path):
+    """
+    Raw source and exported bytes of the round trip; the parsing
+    fixtures below build on these, and header-only tests can parse just
+    what they need.
+    """
     bpy.context.scene.albam.apps.app_selected = app_id
     bpy.context.scene.albam.import_settings.import_only_main_lods = False
 
@@ -73,38 +220,89 @@ def mod_export(loaded_arcs, app_id, mod_path, mrl_path):
     vfile_mrl = bpy.context.scene.albam.vfs.get_vfile(app_id, mrl_path) if mrl_path else None
     assert vfile_mod and ((mrl_path and vfile_mrl) or (not mrl_path and not vfile_mrl))
 
-    result = bpy.ops.albam.import_vfile()
-    assert result == {"FINISHED"}
-    latest_exported = len(bpy.context.scene.albam.exportable.file_list) - 1
-    bpy.context.scene.albam.exportable.file_list_selected_index = latest_exported
-    result = bpy.ops.albam.export()  # FIXME: won't capture failures
-    assert result == {"FINISHED"}
+    src_mod_bytes = vfile_mod.get_bytes()
+    src_mrl_bytes = vfile_mrl.get_bytes() if mrl_path else None
+
+    # The exported bytes depend on the source bytes, the app, and the
+    # exporter code under test, so all three feed the cache key: repeated
+    # local pytest runs skip the Blender round trip, while touching
+    # anything under albam/engines/mtfw or albam/lib invalidates the
+    # entries. Pass --no-mod-cache to force a fresh export regardless.
+    digest = hashlib.sha256(
+        b"::".join((_exporter_code_digest(), app_id.encode(),
+                    src_mod_bytes, src_mrl_bytes or b""))).hexdigest()
+    cached = _mod_export_cache_load(pytestconfig, digest, bool(mrl_path))
+    if cached:
+        dst_mod_bytes, dst_mrl_bytes = cached
+    else:
+        result = bpy.ops.albam.import_vfile()
+        assert result == {"FINISHED"}
+        latest_exported = len(bpy.context.scene.albam.exportable.file_list) - 1
+        bpy.context.scene.albam.exportable.file_list_selected_index = latest_exported
+        result = bpy.ops.albam.export()  # FIXME: won't capture failures
+        assert result == {"FINISHED"}
+
+        vfile_mod_exported = bpy.context.scene.albam.exported.select_vfile(app_id, mod_path)
+        try:
+            vfile_mrl_exported = (bpy.context.scene.albam.exported.get_vfile(app_id, mrl_path)
+                                  if mrl_path else None)
+        except KeyError:
+            mrl_path = mrl_path.replace("_0.mrl", ".mrl")
+            vfile_mrl_exported = (bpy.context.scene.albam.exported.get_vfile(app_id, mrl_path)
+                                  if mrl_path else None)
 
-    vfile_mod_exported = bpy.context.scene.albam.exported.select_vfile(app_id, mod_path)
-    try:
-        vfile_mrl_exported = (bpy.context.scene.albam.exported.get_vfile(app_id, mrl_path)
-                              if mrl_path else None)
-    except KeyError:
-        mrl_path = mrl_path.replace("_0.mrl", ".mrl")
-        vfile_mrl_exported = (bpy.context.scene.albam.exported.get_vfile(app_id, mrl_path)
-                              if mrl_path else None)
+        assert vfile_mod_exported and (
+            (mrl_path and vfile_mrl_exported) or
+            (not mrl_path and not vfile_mrl_exported))
+
+        dst_mod_bytes = vfile_mod_exported.get_bytes()
+        dst_mrl_bytes = vfile_mrl_exported.get_bytes() if mrl_path else None
+        _mod_export_cache_store(pytestconfig, digest, dst_mod_bytes, dst_mrl_bytes)
 
-    assert vfile_mod_exported and (
-        (mrl_path and vfile_mrl_exported) or
-        (not mrl_path and not vfile_mrl_exported))
+    return src_mod_bytes, dst_mod_bytes, src_mrl_bytes, dst_mrl_bytes
+
+
+@pytest.fixture(scope="session")
+def mod_export(app_id, mod_export_bytes):
+    from albam.engines.mtfw.mesh import APPID_CLASS_MAPPER
+    from albam.engines.mtfw.structs.mrl import Mrl
+    from kaitaistruct import KaitaiStream
+
+    src_mod_bytes, dst_mod_bytes, src_mrl_bytes, dst_mrl_bytes = mod_export_bytes
 
     Mod = APPID_CLASS_MAPPER[app_id]
-    src_mod = Mod.from_bytes(vfile_mod.get_bytes())
-    dst_mod = Mod.from_bytes(vfile_mod_exported.get_bytes())
+    src_mod = Mod.from_bytes(src_mod_bytes)
+    dst_mod = Mod.from_bytes(dst_mod_bytes)
     src_mod._read()
     dst_mod._read()
 
-    src_mrl = Mrl(app_id, KaitaiStream(io.BytesIO(vfile_mrl.get_bytes()))) if mrl_path else None
-    dst_mrl = Mrl(app_id, KaitaiStream(io.BytesIO(vfile_mrl_exported.get_bytes()))) if mrl_path else None
-    if mrl_path:
+    src_mrl = Mrl(app_id, KaitaiStream(io.BytesIO(src_mrl_bytes))) if src_mrl_bytes else None
+    dst_mrl = Mrl(app_id, KaitaiStream(io.BytesIO(dst_mrl_bytes))) if dst_mrl_bytes else None
+    if src_mrl:
         src_mrl._read()
+    if dst_mrl:
         dst_mrl._read()
-    return src_mod, dst_mod, src_mrl, dst_mrl
+    return src_mod, dst_mod, src_mrl, dst_mrl, src_mod_bytes == dst_mod_bytes
+
+
+@pytest.fixture(scope="session")
+def headers_only(app_id, mod_export_bytes):
+    """
+    Just the MOD headers of both sides, parsed straight from the raw
+    bytes. Header tests depending on this instead of the full fixtures
+    avoid parsing bones, meshes and vertex buffers when nothing else in
+    the selected tests needs them.
+    """
+    from albam.engines.mtfw.mesh import APPID_CLASS_MAPPER
+    from kaitaistruct import KaitaiStream
+
+    Mod = APPID_CLASS_MAPPER[app_id]
+    headers = []
+    for data in mod_export_bytes[:2]:
+        header = Mod.ModHeader(KaitaiStream(io.BytesIO(data)))
+        header._read()
+        headers.append(header)
+    return tuple(headers)
 
 
 @pytest.fixture(scope="session")
@@ -117,6 +315,127 @@ def mod_exported(mod_export):
     return mod_export[1]
 
 
+@pytest.fixture(scope="session")
+def mod_byte_identical(mod_export):
+    """
+    Whether the exporter round-tripped the MOD byte-perfectly; a single
+    memcmp that makes every field-level comparison trivially true.
+    """
+    return mod_export[4]
+
+
+@dataclass
+class ModPair:
+    """
+    The two sides of a round trip plus derived values the tests share,
+    each memoized on first access.
+    """
+
+    imported: object
+    exported: object
+
+    @cached_property
+    def bones_data_error(self):
+        """
+        Size delta of bones_data between the round trips. Several header
+        offsets shift by exactly this amount in version 156 exports, so
+        the assertions tolerate it.
+        """
+        return abs(self.imported.bones_data.size_ - self.exported.bones_data.size_)
+
+    @cached_property
+    def is_v21(self):
+        return self.imported.header.version in V21_VERSIONS
+
+
+@pytest.fixture(scope="session")
+def modpair(mod_imported, mod_exported):
+    return ModPair(mod_imported, mod_exported)
+
+
+@pytest.fixture(scope="session")
+def bones_data_error(modpair):
+    return modpair.bones_data_error
+
+
+@pytest.fixture(scope="session")
+def is_v21(modpair):
+    return modpair.is_v21
+
+
+def _snapshot(kaitai_obj):
+    return SimpleNamespace(
+        **{k: v for k, v in kaitai_obj.__dict__.items() if not k.startswith("_")})
+
+
+@pytest.fixture(scope="session")
+def header_pair(mod_imported, mod_exported):
+    """
+    Both headers plus facts about them that every header assertion needs,
+    precomputed once per session (hasattr would otherwise go through the
+    __getattr__ machinery on each call). The headers are snapshotted into
+    plain namespaces, so reading a field is a dict lookup with no Kaitai
+    object behind it.
+    """
+    sheader = mod_imported.header
+    dheader = mod_exported.header
+    return SimpleNamespace(
+        src=_snapshot(sheader),
+        dst=_snapshot(dheader),
+        has_reserved_01=hasattr(dheader, "reserved_01"),
+        is_v21=sheader.version in V21_VERSIONS,
+    )
+
+
+@pytest.fixture(scope="session")
+def mod_version(loaded_arcs, app_id, mod_path):
+    """
+    MOD version byte read straight from the source file, so that tests
+    targeting a single version can skip without triggering the expensive
+    ``mod_export`` round trip.
+    """
+    vfile = bpy.context.scene.albam.vfs.get_vfile(app_id, mod_path)
+    return vfile.get_bytes()[4]
+
+
+@pytest.fixture(scope="session")
+def skip_unless_mod_21(mod_version):
+    # session scope matters: same-scope fixtures set up in closure order,
+    # so listing this first in a test signature runs the skip before the
+    # mod_export chain; a function-scoped fixture would run after it
+    if mod_version != 210:
+        pytest.skip("MOD version is not 210")
+
+
+@pytest.fixture(scope="session")
+def bones_arrays(mod_imported, mod_exported):
+    """
+    Bone hierarchies of both mods as numpy structured arrays, extracted
+    once per session so comparisons are a single C-level memcmp instead
+    of per-bone, per-field Python loops.
+    """
+    return (_bones_to_ndarray(mod_imported.bones_data.bones_hierarchy),
+            _bones_to_ndarray(mod_exported.bones_data.bones_hierarchy))
+
+
+@pytest.fixture(scope="session")
+def groups_arrays(mod_imported, mod_exported):
+    return (_groups_to_ndarray(mod_imported.groups),
+            _groups_to_ndarray(mod_exported.groups))
+
+
+@pytest.fixture(scope="session")
+def meshes_arrays(mod_imported, mod_exported, is_v21):
+    """
+    Mesh headers of both mods as numpy structured arrays, built in a
+    single walk per mod so the per-mesh tests index into them instead of
+    re-touching every mesh attribute from Python.
+    """
+    dtype = MESH_DTYPE_21 if is_v21 else MESH_DTYPE_OFFSETS
+    return (_meshes_to_ndarray(mod_imported.meshes_data.meshes, dtype),
+            _meshes_to_ndarray(mod_exported.meshes_data.meshes, dtype))
+
+
 @pytest.fixture(scope="session")
 def mrl_imported(mod_export):
     mrl = mod_export[2]
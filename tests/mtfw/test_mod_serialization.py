@@ -1,24 +1,69 @@
+import numpy as np
 import pytest
 
+# vertex_stride and vertex_format are not round-tripped yet (exporter WIP)
+MESH_FIELDS = [
+    "idx_group", "num_vertices", "unk_01", "idx_material", "level_of_detail",
+    "type_mesh", "unk_class_mesh", "unk_render_mode", "bone_id_start",
+    "num_unique_bone_ids", "mesh_index", "min_index", "max_index", "hash",
+]
 
-def test_export_header(mod_imported, mod_exported):
-    sheader = mod_imported.header
-    dheader = mod_exported.header
+# not round-tripped yet either; compared only in the xfail test below
+MESH_OFFSET_FIELDS = [
+    "vertex_position", "vertex_offset", "face_position", "num_indices", "face_offset",
+]
 
-    bones_data_error = abs(mod_imported.bones_data.size_ - mod_exported.bones_data.size_)
-    assert (sheader.version in (210, 211) and not bones_data_error) or sheader.version == 156
+_V21 = frozenset({210, 211})
+
+# field names of BONE_DTYPE in conftest
+BONE_FIELDS = [
+    "idx_anim_map", "idx_parent", "idx_mirror", "idx_mapping",
+    "unk_01", "parent_distance", "location_x", "location_y", "location_z",
+]
+
+
+def _mesh_selection(mesh_index, src_arr):
+    if mesh_index is None:
+        # dataset entry doesn't declare num_meshes; cover everything here
+        return slice(None)
+    if mesh_index >= len(src_arr):
+        pytest.skip("num_meshes in the dataset exceeds the actual mesh count")
+    return [mesh_index]
+
+
+@pytest.fixture(autouse=True)
+def _skip_if_byte_identical(request):
+    """
+    When the round trip is byte-perfect every comparison in this module
+    passes by construction, so skip them wholesale. The xfail tests still
+    run: they cover fields known to differ, and should surface as XPASS
+    once the exporter gets there.
+    """
+    if request.node.get_closest_marker("xfail"):
+        return
+    if request.getfixturevalue("mod_byte_identical"):
+        pytest.skip("byte-identical round trip; field-level asserts trivially pass")
+
+
+def test_export_header(header_pair, bones_data_error):
+    sheader = header_pair.src
+    dheader = header_pair.dst
+    is_v21 = header_pair.is_v21
+    is_v156 = sheader.version == 156
+
+    assert (is_v21 and not bones_data_error) or is_v156
 
     assert sheader.ident == dheader.ident == b"MOD\x00"
     assert sheader.version == dheader.version
     assert sheader.revision == dheader.revision
     assert sheader.num_bones == dheader.num_bones
     assert sheader.num_materials == dheader.num_materials
-    assert (sheader.version in (210, 211) and sheader.reserved_01 == dheader.reserved_01 or
-            sheader.version == 156 and not getattr(dheader, "reserved_01", None))
+    assert (is_v21 and sheader.reserved_01 == dheader.reserved_01 or
+            is_v156 and not header_pair.has_reserved_01)
     assert sheader.num_groups == dheader.num_groups
     assert sheader.num_meshes == dheader.num_meshes
-    assert ((sheader.version in (210, 211) and sheader.num_vertices == dheader.num_vertices) or
-            sheader.version == 156)  # given 2nd vertex buffer unknowns
+    assert ((is_v21 and sheader.num_vertices == dheader.num_vertices) or
+            is_v156)  # given 2nd vertex buffer unknowns
 
     assert sheader.offset_bones_data == dheader.offset_bones_data
     assert sheader.offset_groups == dheader.offset_groups - bones_data_error
@@ -29,20 +74,19 @@ def test_export_header(mod_imported, mod_exported):
 
 def test_export_top_level(mod_imported, mod_exported):
 
-    # assert mod_imported.bsphere.x == pytest.approx(mod_exported.bsphere.x, rel=0.5)
-    assert mod_imported.bsphere.y == pytest.approx(mod_exported.bsphere.y, rel=0.001)
-    # assert mod_imported.bsphere.z == pytest.approx(mod_exported.bsphere.z, rel=0.001)
-    assert mod_imported.bsphere.w == pytest.approx(mod_exported.bsphere.w, rel=0.001)
+    # bsphere.x and bsphere.z are not compared yet (exporter WIP)
+    assert ((mod_imported.bsphere.y, mod_imported.bsphere.w) ==
+            pytest.approx((mod_exported.bsphere.y, mod_exported.bsphere.w), rel=0.001))
 
-    assert mod_imported.bbox_min.x == pytest.approx(mod_exported.bbox_min.x, rel=0.001)
-    assert mod_imported.bbox_min.y == pytest.approx(mod_exported.bbox_min.y, rel=0.001)
-    assert mod_imported.bbox_min.z == pytest.approx(mod_exported.bbox_min.z, rel=0.001)
-    assert mod_imported.bbox_min.w == pytest.approx(mod_exported.bbox_min.w, rel=0.001)
+    sbb_min = mod_imported.bbox_min
+    dbb_min = mod_exported.bbox_min
+    assert ((sbb_min.x, sbb_min.y, sbb_min.z, sbb_min.w) ==
+            pytest.approx((dbb_min.x, dbb_min.y, dbb_min.z, dbb_min.w), rel=0.001))
 
-    assert mod_imported.bbox_max.x == pytest.approx(mod_exported.bbox_max.x, rel=0.001)
-    assert mod_imported.bbox_max.y == pytest.approx(mod_exported.bbox_max.y, rel=0.001)
-    assert mod_imported.bbox_max.z == pytest.approx(mod_exported.bbox_max.z, rel=0.001)
-    assert mod_imported.bbox_max.w == pytest.approx(mod_exported.bbox_max.w, rel=0.001)
+    sbb_max = mod_imported.bbox_max
+    dbb_max = mod_exported.bbox_max
+    assert ((sbb_max.x, sbb_max.y, sbb_max.z, sbb_max.w) ==
+            pytest.approx((dbb_max.x, dbb_max.y, dbb_max.z, dbb_max.w), rel=0.001))
 
     assert mod_imported.unk_01 == mod_exported.unk_01
     assert mod_imported.unk_02 == mod_exported.unk_02
@@ -50,104 +94,58 @@ def test_export_top_level(mod_imported, mod_exported):
     assert mod_imported.unk_04 == mod_exported.unk_04
 
 
-def test_export_bones_data(mod_imported, mod_exported):
+def test_export_bones_data(modpair):
     # TODO: matrices
-    sbd = mod_imported.bones_data
-    dbd = mod_exported.bones_data
-    bones_data_error = abs(mod_imported.bones_data.size_ - mod_exported.bones_data.size_)
-    assert ((mod_exported.header.version in (210, 211) and not bones_data_error) or
-            mod_exported.header.version == 156)
-
-    assert mod_imported.bones_data_size_ == mod_exported.bones_data_size_ - bones_data_error
-
-    assert (
-        [b.idx_anim_map for b in sbd.bones_hierarchy] ==
-        [b.idx_anim_map for b in dbd.bones_hierarchy])
-    assert (
-        [b.idx_parent for b in sbd.bones_hierarchy] ==
-        [b.idx_parent for b in dbd.bones_hierarchy])
-    assert (
-        [b.idx_mirror for b in sbd.bones_hierarchy] ==
-        [b.idx_mirror for b in dbd.bones_hierarchy])
-    assert (
-        [b.idx_mapping for b in sbd.bones_hierarchy] ==
-        [b.idx_mapping for b in dbd.bones_hierarchy])
-    assert (
-        [b.unk_01 for b in sbd.bones_hierarchy] ==
-        [b.unk_01 for b in dbd.bones_hierarchy])
-    assert (
-        [b.parent_distance for b in sbd.bones_hierarchy] ==
-        [b.parent_distance for b in dbd.bones_hierarchy])
-    assert (
-        [(b.location.x, b.location.y, b.location.z) for b in sbd.bones_hierarchy] ==
-        [(b.location.x, b.location.y, b.location.z) for b in dbd.bones_hierarchy])
+    sbd = modpair.imported.bones_data
+    dbd = modpair.exported.bones_data
+    bones_data_error = modpair.bones_data_error
+    assert (modpair.is_v21 and not bones_data_error) or modpair.exported.header.version == 156
+
+    assert sbd.size_ == dbd.size_ - bones_data_error
 
     assert sbd.bone_map == dbd.bone_map
 
 
-def test_export_groups(mod_imported, mod_exported):
+@pytest.mark.parametrize("field", BONE_FIELDS)
+def test_export_bones_data_field(bones_arrays, field):
+    src_bones, dst_bones = bones_arrays
+    assert np.array_equal(src_bones[field], dst_bones[field])
+
+
+def test_export_groups(mod_imported, mod_exported, groups_arrays):
 
     assert mod_imported.groups_size_ == mod_exported.groups_size_
 
-    assert [g.group_index for g in mod_imported.groups] == [g.group_index for g in mod_exported.groups]
-    assert [g.unk_02 for g in mod_imported.groups] == [g.unk_02 for g in mod_exported.groups]
-    assert [g.unk_03 for g in mod_imported.groups] == [g.unk_03 for g in mod_exported.groups]
-    assert [g.unk_04 for g in mod_imported.groups] == [g.unk_04 for g in mod_exported.groups]
-    assert [g.unk_05 for g in mod_imported.groups] == [g.unk_05 for g in mod_exported.groups]
-    assert [g.unk_06 for g in mod_imported.groups] == [g.unk_06 for g in mod_exported.groups]
-    assert [g.unk_07 for g in mod_imported.groups] == [g.unk_07 for g in mod_exported.groups]
-    assert [g.unk_08 for g in mod_imported.groups] == [g.unk_08 for g in mod_exported.groups]
+    src_groups, dst_groups = groups_arrays
+    assert np.array_equal(src_groups, dst_groups)
 
 
-def test_materials_data(mod_imported, mod_exported):
+def test_materials_data(mod_imported, mod_exported, is_v21):
 
     assert mod_imported.materials_data.size_ == mod_exported.materials_data.size_
-    assert ((mod_imported.header.version in (210, 211) and
+    assert ((is_v21 and
             mod_imported.materials_data.material_names == mod_exported.materials_data.material_names) or
             mod_imported.header.version == 156)
 
 
-def test_meshes_data_21(mod_imported, mod_exported, subtests):
-    if not mod_imported.header.version == 210:
-        pytest.skip()
-
-    for i, mesh in enumerate(mod_imported.meshes_data.meshes):
-        src_mesh = mesh
-        dst_mesh = mod_exported.meshes_data.meshes[i]
-        with subtests.test(mesh_index=i):
-            assert src_mesh.idx_group == dst_mesh.idx_group
-            assert src_mesh.num_vertices == dst_mesh.num_vertices
-            assert src_mesh.unk_01 == dst_mesh.unk_01
-            assert src_mesh.idx_material == dst_mesh.idx_material
-            assert src_mesh.level_of_detail == dst_mesh.level_of_detail
-            assert src_mesh.type_mesh == dst_mesh.type_mesh
-            assert src_mesh.unk_class_mesh == dst_mesh.unk_class_mesh
-            # assert src_mesh.vertex_stride == dst_mesh.vertex_stride
-            assert src_mesh.unk_render_mode == dst_mesh.unk_render_mode
-            # assert src_mesh.vertex_format == dst_mesh.vertex_format
-            assert src_mesh.bone_id_start == dst_mesh.bone_id_start
-            assert src_mesh.num_unique_bone_ids == dst_mesh.num_unique_bone_ids
-            assert src_mesh.mesh_index == dst_mesh.mesh_index
-            assert src_mesh.min_index == dst_mesh.min_index
-            assert src_mesh.max_index == dst_mesh.max_index
-            assert src_mesh.hash == dst_mesh.hash
-
-    assert mod_imported.header.version == 210 and (
-        mod_imported.num_weight_bounds == mod_exported.num_weight_bounds)
+def test_meshes_data_21(skip_unless_mod_21, mod_imported, mod_exported, meshes_arrays, mesh_index):
+    src_arr, dst_arr = meshes_arrays
+    selection = _mesh_selection(mesh_index, src_arr)
+    assert np.array_equal(src_arr[MESH_FIELDS][selection], dst_arr[MESH_FIELDS][selection])
+
+    assert mod_imported.num_weight_bounds == mod_exported.num_weight_bounds
 
 
 @pytest.mark.xfail(reason="WIP")
-def test_header_xfail(pl0000_roundtrip):
+def test_header_xfail(headers_only):
     """
     Tests to fix
     """
-    src_mod, dst_mod = pl0000_roundtrip
-    sheader = src_mod.header
-    dheader = dst_mod.header
+    sheader, dheader = headers_only
 
     assert sheader.num_faces == dheader.num_faces
     assert sheader.num_edges == dheader.num_edges
-    assert sheader.version not in (210, 211) or sheader.size_file == dheader.size_file
+    assert sheader.version not in _V21 or sheader.size_file == dheader.size_file
     # in 210, given we don't export some vertex formats (like the one witih blend shapes of 64 bytes)
     # the size and hence the offset of the index buffer will differ
     assert sheader.offset_index_buffer == dheader.offset_index_buffer
@@ -155,15 +153,11 @@ def test_header_xfail(pl0000_roundtrip):
 
 
 @pytest.mark.xfail(reason="WIP")
-def test_meshes_data_xfail(mod_imported, mod_exported, subtests):
+def test_meshes_data_xfail(mod_imported, mod_exported, meshes_arrays, mesh_index):
 
     assert mod_imported.meshes_data.num_weight_bounds == mod_exported.meshes_data.num_weight_bounds
-    for i, mesh in enumerate(mod_imported.meshes_data.meshes):
-        src_mesh = mesh
-        dst_mesh = mod_exported.meshes_data.meshes[i]
-        with subtests.test(i=i):
-            assert src_mesh.vertex_position == dst_mesh.vertex_position
-            assert src_mesh.vertex_offset == dst_mesh.vertex_offset
-            assert src_mesh.face_position == dst_mesh.face_position
-            assert src_mesh.num_indices == dst_mesh.num_indices
-            assert src_mesh.face_offset == dst_mesh.face_offset
+
+    src_arr, dst_arr = meshes_arrays
+    selection = _mesh_selection(mesh_index, src_arr)
+    assert np.array_equal(src_arr[MESH_OFFSET_FIELDS][selection],
+                          dst_arr[MESH_OFFSET_FIELDS][selection])